@@ -1,7 +1,12 @@
+import os
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
+from matplotlib.colors import to_rgba_array
+from io import BytesIO
+from types import SimpleNamespace
 
 st.set_page_config(page_title="Football and Domestic Violence", layout="wide")
 st.title("⚽ Football and Domestic Violence in Argentina (2024)")
@@ -17,32 +22,56 @@ We count the **number of calls per day** (based on `llamado_fecha`) and match th
 MATCHES_FILE = "Boca_2024_Whole_Year.csv"
 CALLS_FILE = "llamados-violencia-familiar-202407-Argentina.csv"
 
-@st.cache_data
-def load_data(matches_path, calls_path):
-    df_matches = pd.read_csv(matches_path)
-    df_calls = pd.read_csv(calls_path)
+def files_version(*paths):
+    # mtime + size of each file: a cheap cache key that changes when a CSV is replaced
+    return tuple((os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths)
+
+@st.cache_data(max_entries=4, persist="disk")
+def load_data(matches_path, calls_path, version):
+    # `version` is only used as part of the cache key (see files_version)
+    # pyarrow parses the CSVs in multithreaded C++ instead of the default tokenizer.
+    # A few call rows are wrapped in quotes as a whole and have no usable date,
+    # so they are skipped (the default engine read them with an empty date).
+    # Only the call date is used, so the other call columns are not parsed at all.
+    # ISO dates are parsed by the reader itself (no per-row fallback parser).
+    df_matches = pd.read_csv(matches_path, engine="pyarrow", parse_dates=['Date'])
+    df_calls = pd.read_csv(
+        calls_path, engine="pyarrow", on_bad_lines="skip",
+        usecols=['llamado_fecha'], parse_dates=['llamado_fecha']
+    )
 
     df_calls = df_calls.rename(columns={'llamado_fecha': 'call_date'})
     
     # Normalize relevant columns
     # Matches: includes 'Date', 'Boca_Goals', 'Rival_Goals', 'Result', 'Win_Draw_Loss'
-    df_matches['Date'] = pd.to_datetime(df_matches['Date'], errors='coerce').dt.date
+    # Keep dates as datetime64 (normalized to midnight) rather than Python date objects,
+    # so the groupby and the merge below work on int64 keys
+    df_matches['Date'] = pd.to_datetime(df_matches['Date'], errors='coerce').dt.normalize()
 
     # Calls: includes 'call_date' (call date, converted from 'llamado_fecha')
-    df_calls['call_date'] = pd.to_datetime(df_calls['call_date'], errors='coerce').dt.date
+    df_calls['call_date'] = pd.to_datetime(df_calls['call_date'], errors='coerce').dt.normalize()
 
     # Add the number of calls per day
+    # (value_counts is a dedicated counting kernel, lighter than a full groupby;
+    # order does not matter, the table is only merged)
     calls_daily = (
-        df_calls
-        .groupby('call_date', as_index=False)
-        .size()
-        .rename(columns={'call_date': 'Date', 'size': 'call_count'})
+        df_calls['call_date']
+        .value_counts(sort=False)
+        .rename_axis('Date')
+        .reset_index(name='call_count')
     )
 
+    # Low-cardinality text columns are stored as categories (int codes instead of str objects)
+    for col in ['Tournament', 'Instance', 'Result', 'Home_or_Away', 'Win_Draw_Loss', 'Stadium', 'Rival']:
+        if col in df_matches.columns:
+            df_matches[col] = df_matches[col].astype('category')
+
     return df_matches, calls_daily
 
 try:
-    df_matches, calls_daily = load_data(MATCHES_FILE, CALLS_FILE)
+    df_matches, calls_daily = load_data(
+        MATCHES_FILE, CALLS_FILE, files_version(MATCHES_FILE, CALLS_FILE)
+    )
 except Exception as e:
     st.error(f"Error loading files: {e}")
     st.stop()
@@ -52,41 +81,65 @@ st.success("Files loaded successfully ✅")
 # -----------------------------
 # 2) MERGE BY DATE
 # -----------------------------
-merged = pd.merge(df_matches, calls_daily, on='Date', how='inner')
-
-# If the result column is missing, build it from goals (your data already has it)
-if 'Win_Draw_Loss' in merged.columns:
-    result_col = 'Win_Draw_Loss'
-elif 'Result' in merged.columns:
-    result_col = 'Result'
-else:
-    result_col = 'Result'
-    merged[result_col] = merged.apply(
-        lambda r: 'Win' if r['Boca_Goals'] > r['Rival_Goals']
-        else ('Draw' if r['Boca_Goals'] == r['Rival_Goals'] else 'Loss'),
-        axis=1
+# The merge and the tables derived from it only depend on the loaded data,
+# so they are computed once per input and reused on every rerun
+@st.cache_data(max_entries=4)
+def prepare(df_matches, calls_daily):
+    # calls_daily has one row per date, so each match picks up at most one count
+    merged = pd.merge(df_matches, calls_daily, on='Date', how='inner', validate='m:1')
+
+    # If the result column is missing, build it from goals (your data already has it)
+    if 'Win_Draw_Loss' in merged.columns:
+        result_col = 'Win_Draw_Loss'
+    elif 'Result' in merged.columns:
+        result_col = 'Result'
+    else:
+        result_col = 'Result'
+        merged[result_col] = np.select(
+            [merged['Boca_Goals'] > merged['Rival_Goals'], merged['Boca_Goals'] == merged['Rival_Goals']],
+            ['Win', 'Draw'],
+            default='Loss'
+        )
+
+    return SimpleNamespace(
+        merged=merged,
+        result_col=result_col,
+        calls_by_result=merged.groupby(result_col, observed=True)['call_count'].mean().reset_index(),
+        merged_sorted=merged.sort_values('Date'),
     )
 
+prepared = prepare(df_matches, calls_daily)
+merged = prepared.merged
+result_col = prepared.result_col
+
+# Matplotlib charts are rendered once per input to PNG bytes and cached,
+# so reruns reuse the image instead of rebuilding the figure
+def fig_to_png(fig):
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)  # pyplot keeps every figure alive until it is closed
+    return buf.getvalue()
+
 # -----------------------------
 # 3) CHART: Average calls by result
 # -----------------------------
 st.header("📊 Average calls by match result")
 
-calls_by_result = merged.groupby(result_col)['call_count'].mean().reset_index()
+calls_by_result = prepared.calls_by_result
 
-fig, ax = plt.subplots(figsize=(6, 3))
-ax.bar(calls_by_result[result_col], calls_by_result['call_count'], color="#1f77b4")
-ax.set_xlabel("Boca result")
-ax.set_ylabel("Average calls per day")
-ax.set_title("Average calls by result")
-fig.tight_layout()
-st.pyplot(fig, use_container_width=True)
+# Native Streamlit chart: a plain single-colour bar chart needs no matplotlib figure
+st.bar_chart(
+    calls_by_result.set_index(result_col)['call_count'],
+    x_label="Boca result",
+    y_label="Average calls per day",
+    color="#1f77b4",
+)
 
 # -----------------------------
 # 4) CHART: Calls and results combined
 # -----------------------------
 st.header("📅 Calls on match days (time series)")
-merged_sorted = merged.sort_values('Date')
+merged_sorted = prepared.merged_sorted
 
 result_colors = {
     'W': '#2ca02c',
@@ -105,51 +158,61 @@ result_labels = {
     'Loss': 'Loss'
 }
 
-bar_colors = merged_sorted[result_col].map(result_colors).fillna('#1f77b4')
-
-fig_combined, ax_combined = plt.subplots(figsize=(6, 3))
-ax_combined.bar(merged_sorted['Date'], merged_sorted['call_count'], color=bar_colors)
-ax_combined.set_xlabel("Match date")
-ax_combined.set_ylabel("Number of calls")
-ax_combined.set_title("Calls on match days by Boca result")
-ax_combined.tick_params(axis='x', rotation=45)
-
-legend_handles = []
-seen_labels = set()
-for result_value, color in result_colors.items():
-    mask = merged_sorted[result_col] == result_value
-    if mask.any():
-        label = result_labels[result_value]
-        if label not in seen_labels:
-            legend_handles.append(Line2D([0], [0], color=color, lw=6, label=label))
-            seen_labels.add(label)
-
-if legend_handles:
-    ax_combined.legend(handles=legend_handles, title="Result")
-
-fig_combined.tight_layout()
-st.pyplot(fig_combined, use_container_width=True)
+@st.cache_data(max_entries=4)
+def results_timeline_png(merged_sorted, result_col):
+    # Colour lookup by integer code; unknown results get code -1,
+    # which picks the fallback colour appended at the end of the palette.
+    # The palette is converted to RGBA once, so matplotlib gets an (N, 4) array
+    # instead of parsing one hex string per bar
+    palette = to_rgba_array(list(result_colors.values()) + ['#1f77b4'])
+    codes = pd.Index(list(result_colors)).get_indexer(merged_sorted[result_col])
+    bar_colors = palette[codes]
+
+    fig_combined, ax_combined = plt.subplots(figsize=(6, 3))
+    ax_combined.bar(merged_sorted['Date'], merged_sorted['call_count'], color=bar_colors)
+    ax_combined.set_xlabel("Match date")
+    ax_combined.set_ylabel("Number of calls")
+    ax_combined.set_title("Calls on match days by Boca result")
+    ax_combined.tick_params(axis='x', rotation=45)
+
+    # One pass to find the results present, then a dict walk to keep Win/Draw/Loss order
+    present_results = set(merged_sorted[result_col].dropna().unique())
+    legend_handles = []
+    seen_labels = set()
+    for result_value, color in result_colors.items():
+        if result_value in present_results:
+            label = result_labels[result_value]
+            if label not in seen_labels:
+                legend_handles.append(Line2D([0], [0], color=color, lw=6, label=label))
+                seen_labels.add(label)
+
+    if legend_handles:
+        ax_combined.legend(handles=legend_handles, title="Result")
+
+    fig_combined.tight_layout()
+    return fig_to_png(fig_combined)
+
+st.image(results_timeline_png(merged_sorted, result_col), use_container_width=True)
 
 # -----------------------------
 # 5) CHART: Time trend on match days
 # -----------------------------
 st.header("📅 Calls on match days (time series)")
 
-fig2, ax2 = plt.subplots(figsize=(6, 3))
-ax2.plot(merged_sorted['Date'], merged_sorted['call_count'], marker='o', linestyle='-')
-ax2.set_xlabel("Match date")
-ax2.set_ylabel("Number of calls")
-ax2.set_title("Call trend on match days")
-ax2.tick_params(axis='x', rotation=45)
-fig2.tight_layout()
-st.pyplot(fig2, use_container_width=True)
+# Native Streamlit chart: rendered client-side, no matplotlib figure per rerun
+st.line_chart(
+    merged_sorted.set_index('Date')['call_count'],
+    x_label="Match date",
+    y_label="Number of calls",
+)
 
 # -----------------------------
 # 6) CHART: Calls vs goal difference by venue
 # -----------------------------
 st.header("🎯 Calls vs goal difference by venue")
 
-if {'Boca_Goals', 'Rival_Goals'}.issubset(merged.columns):
+@st.cache_data(max_entries=4)
+def venue_scatter_png(merged):
     goal_diff = merged['Boca_Goals'] - merged['Rival_Goals']
     venue_colors = {'Home': '#1f77b4', 'Away': '#ff7f0e'}
     venues_present = merged['Home_or_Away'].dropna().unique() if 'Home_or_Away' in merged.columns else []
@@ -174,7 +237,10 @@ if {'Boca_Goals', 'Rival_Goals'}.issubset(merged.columns):
     ax_scatter.set_ylabel("Number of calls")
     ax_scatter.set_title("Call volume vs goal difference")
     fig_scatter.tight_layout()
-    st.pyplot(fig_scatter, use_container_width=True)
+    return fig_to_png(fig_scatter)
+
+if {'Boca_Goals', 'Rival_Goals'}.issubset(merged.columns):
+    st.image(venue_scatter_png(merged), use_container_width=True)
 else:
     st.info("Columns 'Boca_Goals' and 'Rival_Goals' are required for this chart.")
 
@@ -199,4 +265,8 @@ st.markdown("""
 # -----------------------------
 st.header("🔍 Preview of combined data")
 cols_show = [c for c in ['Date', 'Rival', result_col, 'Boca_Goals', 'Rival_Goals', 'call_count'] if c in merged.columns]
-st.dataframe(merged[cols_show].head(20))
+# Dates stay datetime64 for the merge; show them date-only like before
+st.dataframe(
+    merged[cols_show].head(20),
+    column_config={"Date": st.column_config.DateColumn()},
+)
@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import altair as alt
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # -----------------------------
 # PAGE CONFIG
@@ -81,15 +83,35 @@ RIVER_FILE = BASE_DIR / "River_Plate_2024_Whole_Year.csv"
 DV_FILE    = BASE_DIR / "DV-Calls-AMBA.csv"
 
 
-@st.cache_data
-def load_raw_data():
-    # Read CSVs
-    df_boca = pd.read_csv(BOCA_FILE)
-    df_river = pd.read_csv(RIVER_FILE)
-    df_dv = pd.read_csv(DV_FILE)
+def files_version(*paths):
+    # mtime + size of each file: a cheap cache key that changes when a CSV is replaced
+    return tuple((p.stat().st_mtime_ns, p.stat().st_size) for p in paths)
+
+
+@st.cache_data(max_entries=4, persist="disk")
+def load_raw_data(version):
+    # `version` is only used as part of the cache key (see files_version)
+    # Read CSVs (pyarrow engine: multithreaded C++ parser, ISO dates parsed while reading)
+    # The three files are independent, so they are read concurrently
+    # (the parser releases the GIL; wall time ≈ the slowest file, not the sum)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        boca_read = pool.submit(
+            pd.read_csv, BOCA_FILE, engine="pyarrow",
+            usecols=[  # "Instance" and "Result" are never used
+                "Date", "Rival", "Boca_Goals", "Rival_Goals",
+                "Tournament", "Stadium", "Home_or_Away", "Win_Draw_Loss",
+            ],
+            parse_dates=["Date"],
+        )
+        river_read = pool.submit(pd.read_csv, RIVER_FILE, engine="pyarrow", parse_dates=["Date"])
+        dv_read = pool.submit(
+            pd.read_csv, DV_FILE, engine="pyarrow",
+            usecols=["llamado_fecha"],  # only counted per day
+            parse_dates=["llamado_fecha"],
+        )
+    df_boca, df_river, df_dv = boca_read.result(), river_read.result(), dv_read.result()
 
     # -------- Boca --------
-    df_boca["Date"] = pd.to_datetime(df_boca["Date"])
     df_boca["Team"] = "Boca Juniors"
     df_boca["Opponent"] = df_boca["Rival"]
     df_boca["Goals_For"] = df_boca["Boca_Goals"]
@@ -110,94 +132,121 @@ def load_raw_data():
     df_boca_clean = df_boca[boca_cols]
 
     # -------- River --------
-    df_river["Date"] = pd.to_datetime(df_river["Date"])
-
-    # Split "Score" like "4-0" → home / away goals
-    parts = df_river["Score"].str.split("-", expand=True)
-    df_river["Home_Goals"] = pd.to_numeric(parts[0], errors="coerce")
-    df_river["Away_Goals"] = pd.to_numeric(parts[1], errors="coerce")
-
-    # River as home
-    river_home = df_river[df_river["Home"] == "River Plate"].copy()
-    river_home["Team"] = "River Plate"
-    river_home["Opponent"] = river_home["Away"]
-    river_home["Goals_For"] = river_home["Home_Goals"]
-    river_home["Goals_Against"] = river_home["Away_Goals"]
-    river_home["Home_or_Away"] = "Home"
-
-    # River as away
-    river_away = df_river[df_river["Away"] == "River Plate"].copy()
-    river_away["Team"] = "River Plate"
-    river_away["Opponent"] = river_away["Home"]
-    river_away["Goals_For"] = river_away["Away_Goals"]
-    river_away["Goals_Against"] = river_away["Home_Goals"]
-    river_away["Home_or_Away"] = "Away"
-
-    df_river_all = pd.concat([river_home, river_away], ignore_index=True)
-    df_river_all["Competition"] = df_river_all["Competition"]
-    df_river_all["Stadium"] = None  # not provided in River CSV
-
-    river_cols = [
-        "Date",
-        "Team",
-        "Opponent",
-        "Goals_For",
-        "Goals_Against",
-        "Competition",
-        "Home_or_Away",
-        "Win_Draw_Loss",
-        "Stadium",
-    ]
-    df_river_clean = df_river_all[river_cols]
+    # Split "Score" like "4-0" → home / away goals in one regex pass
+    # (anything that is not "N-N" becomes <NA>, like the old to_numeric coerce)
+    goals = df_river["Score"].str.extract(r"^(\d+)\s*-\s*(\d+)$").astype("Int16")
+    df_river["Home_Goals"] = goals[0]
+    df_river["Away_Goals"] = goals[1]
+
+    # River as home / as away in a single frame: every column picks its
+    # home or away source row by row (no two halves + concat)
+    is_home = df_river["Home"] == "River Plate"
+    is_away = df_river["Away"] == "River Plate"
+    river = df_river[is_home | is_away]
+    is_home = is_home[river.index]
+    df_river_clean = pd.DataFrame({  # same column order as boca_cols
+        "Date": river["Date"],
+        "Team": "River Plate",
+        "Opponent": river["Away"].where(is_home, river["Home"]),
+        "Goals_For": river["Home_Goals"].where(is_home, river["Away_Goals"]),
+        "Goals_Against": river["Away_Goals"].where(is_home, river["Home_Goals"]),
+        "Competition": river["Competition"],
+        "Home_or_Away": np.where(is_home, "Home", "Away"),
+        "Win_Draw_Loss": river["Win_Draw_Loss"],
+        # not provided in River CSV; typed like Boca's column so concat keeps "str"
+        "Stadium": pd.array([None] * len(river), dtype=df_boca_clean["Stadium"].dtype),
+    })
 
     # -------- Combine matches --------
     df_matches = pd.concat([df_boca_clean, df_river_clean], ignore_index=True)
-    df_matches = df_matches.sort_values("Date")
+    df_matches = df_matches.sort_values("Date", kind="stable")  # same-day games: Boca first, then River
+
+    # Results come with stray spaces in the CSVs (e.g. " D"): strip them once here,
+    # so every view (tables, per-team frames, tooltips) shows the clean value
+    df_matches["Win_Draw_Loss"] = df_matches["Win_Draw_Loss"].str.strip()
+
+    # Repeated short strings ("River Plate", "Home", "W"...) stored as categories
+    for col in ["Team", "Opponent", "Competition", "Home_or_Away", "Win_Draw_Loss", "Stadium"]:
+        df_matches[col] = df_matches[col].astype("category")
 
     # -------- DV per day (AMBA) --------
-    df_dv["llamado_fecha"] = pd.to_datetime(df_dv["llamado_fecha"])
+    # value_counts: dedicated counting kernel, sorted by date once aggregated
     dv_daily = (
-        df_dv.groupby("llamado_fecha")
-        .size()
+        df_dv["llamado_fecha"]
+        .value_counts(sort=False)
+        .sort_index()
+        .rename_axis("Date")
         .reset_index(name="dv_calls_AMBA")
     )
-    dv_daily = dv_daily.rename(columns={"llamado_fecha": "Date"})
-    dv_daily = dv_daily.sort_values("Date")
-    
-    # Creamos una versión genérica con columna "Calls"
-    df_calls_daily = dv_daily.rename(columns={"dv_calls_AMBA": "Calls"}).copy()
 
+    # Only the base frames go through the disk cache; everything derived
+    # from them is rebuilt by build_views (in-memory cache)
+    return df_matches, dv_daily
 
-    # Merge DV with matches on date
-    df_matches_dv = pd.merge(
-        df_matches,
-        dv_daily,
-        on="Date",
-        how="left",
-    )
+
+@st.cache_data(max_entries=4)
+def build_views(df_matches, dv_daily):
+    # Creamos una versión genérica con columna "Calls"
+    # (rename ya devuelve un DataFrame nuevo, reutiliza el mismo conteo diario)
+    df_calls_daily = dv_daily.rename(columns={"dv_calls_AMBA": "Calls"})
+
+    # Add DV calls to matches on date
+    # (dv_daily is unique per Date, so a lookup into its Date index is enough;
+    # reset_index keeps the 0..n-1 index the old left merge produced)
+    df_matches_dv = df_matches.join(
+        dv_daily.set_index("Date")["dv_calls_AMBA"], on="Date", validate="m:1"
+    ).reset_index(drop=True)
     
-    return df_matches, dv_daily, df_matches_dv, df_calls_daily
+    # One view per sidebar "Team" option, filtered once here instead of on every rerun
+    team_views = {"All": df_matches_dv}
+    for team in ["Boca Juniors", "River Plate"]:
+        team_views[team] = df_matches_dv[df_matches_dv["Team"] == team]
+
+    return df_matches_dv, df_calls_daily, team_views
 
 
-# Load data once (cached)
-df_matches, dv_daily, df_matches_dv, df_calls_daily = load_raw_data()
+# Load data once (cached until one of the CSVs changes)
+df_matches, dv_daily = load_raw_data(files_version(BOCA_FILE, RIVER_FILE, DV_FILE))
+df_matches_dv, df_calls_daily, team_views = build_views(df_matches, dv_daily)
 
 # -----------------------------
 # 2) SIDEBAR CONTROLS
 # -----------------------------
 st.sidebar.header("Filters")
 
-team_options = ["All", "Boca Juniors", "River Plate"]
+team_options = list(team_views)  # "All", "Boca Juniors", "River Plate"
 selected_team = st.sidebar.selectbox("Team", team_options)
 
 view_options = ["Matches + DV calls", "DV daily time series", "Raw data"]
 selected_view = st.sidebar.radio("View", view_options)
 
-# Filter by team if needed
-if selected_team == "All":
-    df_matches_filtered = df_matches_dv.copy()
-else:
-    df_matches_filtered = df_matches_dv[df_matches_dv["Team"] == selected_team]
+# Team filter precomputed in build_views (the views below only read it)
+df_matches_filtered = team_views[selected_team]
+
+# Only the first rows of each table are sent to the browser
+MAX_TABLE_ROWS = 500
+
+
+def show_table(df):
+    st.dataframe(df.head(MAX_TABLE_ROWS))
+    if len(df) > MAX_TABLE_ROWS:
+        st.caption(f"Showing the first {MAX_TABLE_ROWS} of {len(df)} rows.")
+
+
+# Daily series longer than this are averaged over N-day bins before charting,
+# with N chosen so that Vega-Lite never gets more than MAX_CHART_POINTS rows
+MAX_CHART_POINTS = 2000
+
+
+def chart_data(df, value_cols):
+    # Expects one row per day (do not pass frames joined with the matches)
+    if len(df) <= MAX_CHART_POINTS:
+        return df
+    span_days = (df["Date"].max() - df["Date"].min()).days + 1
+    bin_days = -(-span_days // MAX_CHART_POINTS)  # ceil
+    # Mean per bin keeps the "calls per day" scale of the match-day points
+    return df.resample(f"{bin_days}D", on="Date")[value_cols].mean().reset_index()
+
 
 # -----------------------------
 # 3) MAIN VIEWS
@@ -210,12 +259,13 @@ if selected_view == "Matches + DV calls":
     on that date.
     """)
 
-    st.dataframe(df_matches_filtered)
+    show_table(df_matches_filtered)
 
     st.markdown("### Basic summary")
     st.write("Total matches in selection:", len(df_matches_filtered))
 
-    total_calls_on_match_days = df_matches_filtered["dv_calls_AMBA"].sum()
+    # Plain ndarray reduction (days without calls are NaN and are skipped)
+    total_calls_on_match_days = np.nansum(df_matches_filtered["dv_calls_AMBA"].to_numpy())
     st.write(
         "Sum of DV calls on those match days (AMBA):",
         int(total_calls_on_match_days)
@@ -235,7 +285,7 @@ elif selected_view == "DV daily time series":
     )
 
     st.markdown("Preview of daily data:")
-    st.dataframe(dv_daily)
+    show_table(dv_daily)
 
 else:  # "Raw data"
     tab1, tab2, tab3 = st.tabs(
@@ -244,15 +294,15 @@ else:  # "Raw data"
 
     with tab1:
         st.subheader("Raw matches data (Boca + River)")
-        st.dataframe(df_matches)
+        show_table(df_matches)
 
     with tab2:
         st.subheader("DV daily counts – AMBA")
-        st.dataframe(dv_daily)
+        show_table(dv_daily)
 
     with tab3:
         st.subheader("Matches + DV calls merged on Date")
-        st.dataframe(df_matches_dv)
+        show_table(df_matches_dv)
 
 st.markdown("---")
 
@@ -262,8 +312,7 @@ st.markdown("---")
 # -----------------------------
 st.subheader("Overview – Matches & DV Calls")
 
-# Ensure Date is datetime
-df_matches["Date"] = pd.to_datetime(df_matches["Date"], dayfirst=True, errors="coerce")
+# "Date" is already datetime64 (parsed once in load_raw_data)
 
 # Normalize results
 df_matches["Win_Draw_Loss"] = df_matches["Win_Draw_Loss"].astype(str).str.strip()
@@ -275,18 +324,29 @@ result_map = {
     "Loss": 0, "L": 0
 }
 
+
+def map_results(results, mapping):
+    # Integer code per row (-1 = unknown result) and one gather from a small
+    # lookup table, instead of a dict lookup per row; unknown results → NaN
+    codes = pd.Index(list(mapping)).get_indexer(results)
+    table = np.append(np.fromiter(mapping.values(), dtype="float64"), np.nan)
+    return table[codes]
+
+
 # -----------------------------
-# BOCA cumulative points
+# Cumulative points (both teams in one pass)
 # -----------------------------
-df_boca_matches = (
-    df_matches[df_matches["Team"].str.contains("Boca", case=False, na=False)]
-    .copy()
-    .sort_values("Date")
-)
+# df_matches is already sorted by Date in load_raw_data,
+# so a cumsum per team gives each team's running total
+df_matches["Points"] = map_results(df_matches["Win_Draw_Loss"], result_map)
+df_matches["CumPoints"] = df_matches.groupby("Team", observed=True)["Points"].cumsum()
 
-df_boca_matches["Points"] = df_boca_matches["Win_Draw_Loss"].map(result_map)
-df_boca_matches["CumPoints"] = df_boca_matches["Points"].cumsum()
+df_boca_matches = df_matches[df_matches["Team"] == "Boca Juniors"]
+df_river_matches = df_matches[df_matches["Team"] == "River Plate"]
 
+# -----------------------------
+# BOCA cumulative points
+# -----------------------------
 st.markdown("#### Graph 1 – Boca Juniors (Cumulative Points)")
 
 chart_boca = (
@@ -305,15 +365,6 @@ st.altair_chart(chart_boca, use_container_width=True)
 # -----------------------------
 # RIVER cumulative points
 # -----------------------------
-df_river_matches = (
-    df_matches[df_matches["Team"].str.contains("River", case=False, na=False)]
-    .copy()
-    .sort_values("Date")
-)
-
-df_river_matches["Points"] = df_river_matches["Win_Draw_Loss"].map(result_map)
-df_river_matches["CumPoints"] = df_river_matches["Points"].cumsum()
-
 st.markdown("#### Graph 2 – River Plate (Cumulative Points)")
 
 chart_river = (
@@ -353,7 +404,7 @@ st.markdown("# Complex graphs")
 st.markdown("### Daily DV Calls (AMBA)")
 
 chart_dv = (
-    alt.Chart(dv_daily)
+    alt.Chart(chart_data(dv_daily, ["dv_calls_AMBA"]))
     .mark_bar()
     .encode(
         x="Date:T",
@@ -370,48 +421,58 @@ st.altair_chart(chart_dv, use_container_width=True)
 
 st.markdown("### Combined DV Calls + Boca & River Matches")
 
-# Primero, matcheamos los días de partido con las llamadas de DV
-boca_match_days = df_boca_matches.merge(dv_daily, on="Date", how="left")
-river_match_days = df_river_matches.merge(dv_daily, on="Date", how="left")
-
-# Barras de llamadas DV (AMBA)
-dv_chart = (
-    alt.Chart(dv_daily)
-    .mark_bar()
-    .encode(
-        x="Date:T",
-        y="dv_calls_AMBA:Q",
-        tooltip=["Date:T", "dv_calls_AMBA:Q"]
+# Días de partido con sus llamadas de DV: ya vienen unidos en las vistas por equipo
+# (solo las columnas que usa el gráfico, no todo el DataFrame de partidos)
+overlay_cols = ["Date", "Opponent", "Win_Draw_Loss", "dv_calls_AMBA"]
+boca_match_days = team_views["Boca Juniors"][overlay_cols]
+river_match_days = team_views["River Plate"][overlay_cols]
+
+# El spec del gráfico se arma una vez por datos de entrada y queda cacheado
+# (en cada rerun solo se reenvía el dict, sin reconstruir las capas de Altair)
+@st.cache_data(max_entries=4)
+def combined_chart_spec(dv_daily, boca_match_days, river_match_days):
+    # Barras de llamadas DV (AMBA)
+    # (sin tooltip: son el fondo, la info al pasar el mouse está en los puntos)
+    dv_chart = (
+        alt.Chart(chart_data(dv_daily, ["dv_calls_AMBA"]))
+        .mark_bar()
+        .encode(
+            x="Date:T",
+            y="dv_calls_AMBA:Q",
+        )
     )
-)
 
-# Puntos para días de partido de Boca
-boca_points = (
-    alt.Chart(boca_match_days)
-    .mark_point(size=80, filled=True)
-    .encode(
-        x="Date:T",
-        y="dv_calls_AMBA:Q",
-        color=alt.value("blue"),
-        tooltip=["Date:T", "Opponent:N", "Win_Draw_Loss:N", "dv_calls_AMBA:Q"]
+    # Puntos para días de partido de Boca
+    boca_points = (
+        alt.Chart(boca_match_days)
+        .mark_point(size=80, filled=True)
+        .encode(
+            x="Date:T",
+            y="dv_calls_AMBA:Q",
+            color=alt.value("blue"),
+            tooltip=["Date:T", "Opponent:N", "Win_Draw_Loss:N", "dv_calls_AMBA:Q"]
+        )
     )
-)
 
-# Puntos para días de partido de River
-river_points = (
-    alt.Chart(river_match_days)
-    .mark_point(size=80, filled=True)
-    .encode(
-        x="Date:T",
-        y="dv_calls_AMBA:Q",
-        color=alt.value("red"),
-        tooltip=["Date:T", "Opponent:N", "Win_Draw_Loss:N", "dv_calls_AMBA:Q"]
+    # Puntos para días de partido de River
+    river_points = (
+        alt.Chart(river_match_days)
+        .mark_point(size=80, filled=True)
+        .encode(
+            x="Date:T",
+            y="dv_calls_AMBA:Q",
+            color=alt.value("red"),
+            tooltip=["Date:T", "Opponent:N", "Win_Draw_Loss:N", "dv_calls_AMBA:Q"]
+        )
     )
-)
 
-combined_chart = (dv_chart + boca_points + river_points).properties(height=350)
+    return (dv_chart + boca_points + river_points).properties(height=350).to_dict()
 
-st.altair_chart(combined_chart, use_container_width=True)
+
+st.vega_lite_chart(
+    combined_chart_spec(dv_daily, boca_match_days, river_match_days),
+    use_container_width=True,
+)
 
 
 
@@ -428,75 +489,102 @@ result_num_map = {
     "Loss": -1, "L": -1
 }
 
-# Normalizar la columna de resultados a string limpio
-df_matches["Win_Draw_Loss"] = df_matches["Win_Draw_Loss"].astype(str).str.strip()
-df_matches["ResultNum"] = df_matches["Win_Draw_Loss"].map(result_num_map)
+# "Win_Draw_Loss" ya quedó normalizada (str + strip) en la sección 4
+df_matches["ResultNum"] = map_results(df_matches["Win_Draw_Loss"], result_num_map)
+
+def rolling_mean_3(values):
+    # Ventana fija de 3 → una convolución (suma) y después /3, igual que
+    # rolling(window=3, center=True).mean(): los extremos, y series de menos
+    # de 3 días, quedan en NaN
+    values = values.to_numpy(dtype="float64")
+    out = np.full(len(values), np.nan)
+    if len(values) >= 3:
+        out[1:-1] = np.convolve(values, np.ones(3), mode="valid") / 3
+    return out
+
+
+# 2) y 3) se calculan una vez por datos de entrada y quedan cacheados
+@st.cache_data(max_entries=4)
+def results_view(df_calls_daily, match_results):
+    # 2) Merge: llamadas por día + info de partidos (Boca y River)
+    df_merged = df_calls_daily.merge(
+        match_results,
+        on="Date",
+        how="left",
+        validate="1:m",
+    )
 
-# 2) Merge: llamadas por día + info de partidos (Boca y River)
-df_merged = df_calls_daily.merge(
-    df_matches[["Date", "Team", "ResultNum"]],
-    on="Date",
-    how="left"
-)
+    # 3) Promedio móvil para suavizar ruido
+    df_merged["Rolling_Calls"] = rolling_mean_3(df_merged["Calls"])
 
-# 3) Promedio móvil para suavizar ruido
-df_merged["Rolling_Calls"] = (
-    df_merged["Calls"]
-    .rolling(window=3, center=True)
-    .mean()
-)
+    # Datos de las líneas: si la serie diaria es muy larga se agrupa por bins
+    # antes del merge (una fila por día, sin duplicar días con dos partidos)
+    # y el promedio móvil se calcula sobre esos bins
+    if len(df_calls_daily) > MAX_CHART_POINTS:
+        df_lines = chart_data(df_calls_daily, ["Calls"])
+        df_lines["Rolling_Calls"] = rolling_mean_3(df_lines["Calls"])
+    else:
+        df_lines = df_merged
+    return df_merged, df_lines
+
+
+df_merged, df_lines = results_view(df_calls_daily, df_matches[["Date", "Team", "ResultNum"]])
 
 # ------------------------------------------------------
 # LINE GRAPH (Altair)
 # ------------------------------------------------------
 
-# Línea de llamadas diarias
-line_calls = alt.Chart(df_merged).mark_line().encode(
-    x="Date:T",
-    y="Calls:Q",
-    tooltip=["Date:T", "Calls:Q"]
-)
-
-# Línea de promedio móvil (discontinua)
-line_smooth = alt.Chart(df_merged).mark_line(strokeDash=[5, 5]).encode(
-    x="Date:T",
-    y="Rolling_Calls:Q",
-    tooltip=["Date:T", "Rolling_Calls:Q"]
-)
-
-# Puntos en los días con partido (colores según resultado)
-points_matches = (
-    alt.Chart(df_merged[df_merged["ResultNum"].notna()])
-    .mark_point(size=120)
-    .encode(
+@st.cache_data(max_entries=4)
+def results_chart_spec(df_merged, df_lines):
+    # Líneas de llamadas: diarias, o por bins si la serie es muy larga (ver results_view)
+    # Línea de llamadas diarias
+    line_calls = alt.Chart(df_lines).mark_line().encode(
         x="Date:T",
         y="Calls:Q",
-        color=alt.Color(
-            "ResultNum:N",
-            scale=alt.Scale(
-                domain=[1, 0, -1],
-                range=["green", "gray", "red"]
-            ),
-            legend=alt.Legend(
-                title="Match Result",
-                labelExpr=(
-                    "datum.value == 1 ? 'Win' : "
-                    "datum.value == 0 ? 'Draw' : 'Loss'"
+        tooltip=["Date:T", "Calls:Q"]
+    )
+
+    # Línea de promedio móvil (discontinua)
+    line_smooth = alt.Chart(df_lines).mark_line(strokeDash=[5, 5]).encode(
+        x="Date:T",
+        y="Rolling_Calls:Q",
+        tooltip=["Date:T", "Rolling_Calls:Q"]
+    )
+
+    # Puntos en los días con partido (colores según resultado)
+    points_matches = (
+        alt.Chart(df_merged[df_merged["ResultNum"].notna()])
+        .mark_point(size=120)
+        .encode(
+            x="Date:T",
+            y="Calls:Q",
+            color=alt.Color(
+                "ResultNum:N",
+                scale=alt.Scale(
+                    domain=[1, 0, -1],
+                    range=["green", "gray", "red"]
+                ),
+                legend=alt.Legend(
+                    title="Match Result",
+                    labelExpr=(
+                        "datum.value == 1 ? 'Win' : "
+                        "datum.value == 0 ? 'Draw' : 'Loss'"
+                    )
                 )
-            )
-        ),
-        shape="Team:N",
-        tooltip=["Date:T", "Team:N", "ResultNum:Q", "Calls:Q"]
+            ),
+            shape="Team:N",
+            tooltip=["Date:T", "Team:N", "ResultNum:Q", "Calls:Q"]
+        )
     )
-)
 
-graph = (line_calls + line_smooth + points_matches).properties(
-    width=900,
-    height=400,
-    title="Do Violence Calls Increase or Decrease When Boca/River Win or Lose?"
-)
+    return (line_calls + line_smooth + points_matches).properties(
+        width=900,
+        height=400,
+        title="Do Violence Calls Increase or Decrease When Boca/River Win or Lose?"
+    ).to_dict()
+
 
-st.altair_chart(graph, use_container_width=True)
+st.vega_lite_chart(results_chart_spec(df_merged, df_lines), use_container_width=True)
 
 
 # ------------------------------------------------------